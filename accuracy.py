@@ -0,0 +1,126 @@
+"""
+This module contains the implementation of checking the target
+reconstruction accuracy, which is used by the compression algorithms
+to choose the number of components.
+
+Main function uses implementation of calculating:
+    1) Maximum absolute delta value between input data and
+       data after compression and decompression.
+    2) Share of the variance which is kept after compression
+       and decompression (explained variance).
+
+Datatype to operate on:
+    Pandas DataFrame.
+
+Note:
+    Values are compared by position, labels of index and columns are ignored.
+
+Contact info:
+Antonina Bondarchuk (c)
+antonina.bondarchuk@nure.ua
+2020
+"""
+
+import numpy as np
+
+
+def validate_target(max_delta=None, explained_variance=None):
+    """
+    Checks if the target reconstruction accuracy is set and valid.
+    Args:
+        max_delta (float): maximum allowed absolute delta value
+            in the whole DataFrame, not negative.
+        explained_variance (float): minimum share of the variance
+            to keep, in (0, 1].
+
+    Raises:
+        TypeError: if none of the targets is given or any of them
+            is out of its range.
+    """
+    if max_delta is None and explained_variance is None:
+        raise TypeError('To check the reconstruction accuracy, '
+                        'please, set max_delta or explained_variance.')
+    if max_delta is not None and not max_delta >= 0:
+        raise TypeError('Target max_delta should not be negative, '
+                        f'got {max_delta}.')
+    if explained_variance is not None and not 0 < explained_variance <= 1:
+        raise TypeError('Target explained_variance should be in (0, 1], '
+                        f'got {explained_variance}.')
+
+
+def get_max_abs_delta(df1, df2):
+    """
+    Calculates absolute maximum delta value between the dataframes.
+    Args:
+        df1 (Pandas DataFrame): DataFrame before operating.
+        df2 (Pandas DataFrame): DataFrame after operations.
+
+    Returns:
+        Float.
+
+    Raises:
+        TypeError: if the input DataFrames have different shapes.
+    """
+    arr1, arr2 = np.asarray(df1, dtype=float), np.asarray(df2, dtype=float)
+    if arr1.shape != arr2.shape:
+        raise TypeError('Cannot compare the dataframes '
+                        f'of shapes {arr1.shape} and {arr2.shape}.')
+    return np.abs(arr1 - arr2).max()
+
+
+def get_explained_variance(df1, df2):
+    """
+    Calculates share of the variance of the data which is kept
+    after operations (e.g. compression and decompression).
+    Args:
+        df1 (Pandas DataFrame): DataFrame before operating.
+        df2 (Pandas DataFrame): DataFrame after operations.
+
+    Returns:
+        Float explained variance ratio.
+
+    Raises:
+        TypeError: if the input DataFrames have different shapes.
+    """
+    arr1, arr2 = np.asarray(df1, dtype=float), np.asarray(df2, dtype=float)
+    if arr1.shape != arr2.shape:
+        raise TypeError('Cannot compare the dataframes '
+                        f'of shapes {arr1.shape} and {arr2.shape}.')
+    total_variance = ((arr1 - arr1.mean(axis=0)) ** 2).sum()
+    if not total_variance:
+        return 1.
+    residual_variance = ((arr1 - arr2) ** 2).sum()
+    return 1 - residual_variance / total_variance
+
+
+def is_accurate_enough(df1, df2, max_delta=None, explained_variance=None):
+    """
+    Checks if the DataFrame after operations meets the target
+    reconstruction accuracy. Every given target should be met,
+    NaN values never meet the target.
+    Args:
+        df1 (Pandas DataFrame): DataFrame before operating.
+        df2 (Pandas DataFrame): DataFrame after operations
+            (e.g. compression and decompression).
+        max_delta (float): maximum allowed absolute delta value
+            in the whole DataFrame, not negative.
+        explained_variance (float): minimum share of the variance
+            to keep, in (0, 1].
+    References:
+        validate_target, get_max_abs_delta, get_explained_variance.
+
+    Returns:
+        Bool.
+
+    Raises:
+        TypeError: if the targets are invalid or
+            the input DataFrames have different shapes.
+    """
+    validate_target(max_delta, explained_variance)
+    if max_delta is not None:
+        if not get_max_abs_delta(df1, df2) <= max_delta:
+            return False
+    if explained_variance is not None:
+        if not get_explained_variance(df1, df2) >= explained_variance:
+            return False
+    return True
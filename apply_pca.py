@@ -2,7 +2,8 @@
 This module contains the implementation of Principal Component Analysis.
 Read more here: https://en.wikipedia.org/wiki/Principal_component_analysis
 Main function to use is apply_pca, which includes compression as well
-as decompression step.
+as decompression step. To choose the number of components by the target
+reconstruction accuracy use apply_pca_to_target.
 
 Datatype to operate on:
     Pandas DataFrame.
@@ -16,9 +17,10 @@ antonina.bondarchuk@nure.ua
 2020
 """
 
-from numpy import mean, dot
+from numpy import mean, dot, cumsum, searchsorted
 from pandas import DataFrame
 from sklearn.decomposition import PCA
+from accuracy import validate_target, is_accurate_enough
 
 
 def pca_compression(dataframe, n_components=2):
@@ -46,6 +48,23 @@ def pca_compression(dataframe, n_components=2):
     return pca
 
 
+def pca_reconstruction(transformed_arr, pca, df_mean, n_components=2):
+    """
+    Reconstructs data from its projection on the first n_components.
+    Args:
+        transformed_arr (Numpy Array): data projected with pca.transform.
+        pca (sklearn.decomposition._pca.PCA): to reach components.
+        df_mean (Numpy Array): mean values by column of the original data.
+        n_components (int): number of the components to get.
+
+    Returns:
+        Numpy Array.
+    """
+    result_arr = dot(transformed_arr[:, :n_components],
+                     pca.components_[:n_components, :])
+    return result_arr + df_mean
+
+
 def pca_decompression(dataframe, pca, n_components=2):
     """
     Implements decompression using PCA decompression calculations.
@@ -66,10 +85,9 @@ def pca_decompression(dataframe, pca, n_components=2):
     if dataframe.empty:
         raise TypeError('It is impossible to apply PCA decompression '
                         'on the empty DataFrame.')
-    df_mean = mean(dataframe, axis='rows')
-    result_arr = dot(pca.transform(dataframe)[:, :n_components],
-                     pca.components_[:n_components, :])
-    result_arr += df_mean
+    df_mean = mean(dataframe, axis='rows').to_numpy()
+    result_arr = pca_reconstruction(pca.transform(dataframe), pca,
+                                    df_mean, n_components)
     result_df = DataFrame(result_arr, columns=list(dataframe))
     return result_df
 
@@ -99,3 +117,59 @@ def apply_pca(dataframe, n_components=2):
     # decompression
     decompressed_df = pca_decompression(dataframe, pca, n_components)
     return decompressed_df
+
+
+def apply_pca_to_target(dataframe, max_delta=None, explained_variance=None):
+    """
+    Implements Principal Component Analysis compression and decompression
+    with the least number of the components which meets the target
+    reconstruction accuracy. Components are fitted and projected once,
+    then added one by one until the target is met. If only
+    explained_variance is set, the search starts right below the number
+    of the components estimated from the cumulative explained variance ratio.
+    Args:
+        dataframe (Pandas DataFrame): contains data after Data Preprocessing stage.
+        max_delta (float): maximum allowed absolute delta value
+            in the whole DataFrame, not negative.
+        explained_variance (float): minimum share of the variance
+            to keep, in (0, 1].
+    References:
+        pca_compression, pca_reconstruction,
+        accuracy.validate_target, accuracy.is_accurate_enough.
+
+    Returns:
+        Tuple (Pandas DataFrame, int, bool):
+        decompressed DataFrame, the chosen number of the components
+        and if the target is met. If the target is never met,
+        all the components are used and the flag is False.
+
+    Raises:
+        TypeError: if input DataFrame is empty or the targets are invalid.
+    """
+    if dataframe.empty:
+        raise TypeError('It is impossible to apply PCA compression '
+                        'and decompression on the empty DataFrame.')
+    validate_target(max_delta, explained_variance)
+    # compression with all the components
+    pca = pca_compression(dataframe, n_components=None)
+    transformed_arr = pca.transform(dataframe)
+    df_mean = mean(dataframe, axis='rows').to_numpy()
+
+    # decompression with the growing number of the components
+    first_n_components = 1
+    if max_delta is None:
+        # ratio estimate can be off by floating point error near the target,
+        # so it is confirmed with the same check as in the other cases
+        ratio_cumsum = cumsum(pca.explained_variance_ratio_)
+        first_n_components = max(int(searchsorted(ratio_cumsum, explained_variance)), 1)
+    is_target_met = False
+    for n_components in range(min(first_n_components, pca.n_components_),
+                              pca.n_components_ + 1):
+        result_arr = pca_reconstruction(transformed_arr, pca, df_mean, n_components)
+        if is_accurate_enough(dataframe, result_arr,
+                              max_delta=max_delta,
+                              explained_variance=explained_variance):
+            is_target_met = True
+            break
+    result_df = DataFrame(result_arr, columns=list(dataframe))
+    return result_df, n_components, is_target_met
@@ -24,6 +24,15 @@ References:
         NULL_VALUES (optional): sequence of symbols to mark null values in data.
             Example: >>> '?, Nan, NA, N/a, NaN'
             Note: '' need to be checked.
+        NUM_COMPONENTS (optional): number of the PCA components to calculate.
+            Note: ignored if MAX_DELTA or EXPLAINED_VARIANCE is set.
+        MAX_DELTA (optional): maximum allowed absolute delta value after
+            decompression. Number of the components is chosen to meet it.
+            Example: >>> '0.05'
+        EXPLAINED_VARIANCE (optional): minimum share of the variance to keep
+            after decompression, in (0, 1]. Number of the components
+            is chosen to meet it.
+            Example: >>> '0.95'
 
 Contact info:
 Antonina Bondarchuk (c)
@@ -34,8 +43,8 @@ antonina.bondarchuk@nure.ua
 import os
 from statistics import get_statistics
 from dotenv import load_dotenv
-from oja import apply_oja
-from apply_pca import apply_pca
+from oja import apply_oja, apply_oja_to_target
+from apply_pca import apply_pca, apply_pca_to_target
 from preprocessing import prepare
 from reading import read_file_to_df
 
@@ -54,12 +63,28 @@ if __name__ == "__main__":
     # data preprocessing
     prepared_df = prepare(raw_input_df, null_values=os.getenv('NULL_VALUES'))
 
-    # applying PCA
-    pca_df = apply_pca(prepared_df,
-                       n_components=int(os.getenv('NUM_COMPONENTS', DEFAULT_NUM_COMPONENTS)))
+    max_delta = os.getenv('MAX_DELTA')
+    explained_variance = os.getenv('EXPLAINED_VARIANCE')
+    if max_delta is not None or explained_variance is not None:
+        target = {
+            'max_delta': float(max_delta) if max_delta is not None else None,
+            'explained_variance': (float(explained_variance)
+                                   if explained_variance is not None else None),
+        }
 
-    # applying Oja
-    oja_df = apply_oja(prepared_df)
+        # applying PCA and Oja with the number of components chosen by the target
+        pca_df, pca_num_components, pca_target_met = apply_pca_to_target(prepared_df, **target)
+        oja_df, oja_num_components, oja_target_met = apply_oja_to_target(prepared_df, **target)
+        print(f'Components chosen: '
+              f'PCA - {pca_num_components} (target {"met" if pca_target_met else "not met"}), '
+              f'Oja - {oja_num_components} (target {"met" if oja_target_met else "not met"}).')
+    else:
+        # applying PCA
+        pca_df = apply_pca(prepared_df,
+                           n_components=int(os.getenv('NUM_COMPONENTS', DEFAULT_NUM_COMPONENTS)))
+
+        # applying Oja
+        oja_df = apply_oja(prepared_df)
 
     # getting statistics for PCA and Oja
     pca_delta_df, pca_cols_delta_df, pca_max_delta, pca_accuracy = get_statistics(prepared_df, pca_df)
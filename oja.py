@@ -6,7 +6,8 @@ Main function uses implementation of:
         1.1) Generating start vector w0.
         1.2) Calculating main components (y and w vectors for each).
         1.3) Dividing main components from the original data
-             one by one.
+             one by one (optionally, until the target
+             reconstruction accuracy is met).
     2) Oja's Decompression rule.
 
 Datatype to operate on:
@@ -21,6 +22,7 @@ antonina.bondarchuk@nure.ua
 from random import uniform
 import numpy as np
 from pandas import DataFrame
+from accuracy import validate_target, is_accurate_enough
 
 
 def generate_start_w0(columns_num):
@@ -135,17 +137,29 @@ def subtract_component(dataframe, component_y, vector_w):
     return result_df
 
 
-def compress(dataframe):
+def compress(dataframe, max_delta=None, explained_variance=None):
     """
     Compress data in n_components using Oja's rule.
     Read more here: https://en.wikipedia.org/wiki/Oja%27s_rule
+    If max_delta or explained_variance is set, components are calculated
+    only until the residual meets the target reconstruction accuracy,
+    otherwise all the components are calculated.
     Args:
         dataframe (Pandas DataFrame): data to compress.
+        max_delta (float): maximum allowed absolute delta value
+            in the whole DataFrame, not negative.
+        explained_variance (float): minimum share of the variance
+            to keep, in (0, 1].
+    Note:
+        Targets are not validated here, use accuracy.validate_target.
+    References:
+        accuracy.is_accurate_enough.
 
     Returns:
         Tuple:
-        (Matrix of components Y [df_rows x df_columns] as Numpy Array,
-         Matrix of components W [df_columns x df_columns] as Numpy Array).
+        (Matrix of components Y [n_components x df_rows] as Numpy Array,
+         Matrix of components W [n_components x df_columns] as Numpy Array,
+         if the target is met as bool, None if no target is set).
 
     Raises:
         TypeError: if the input DataFrame is empty.
@@ -153,6 +167,9 @@ def compress(dataframe):
     if dataframe.empty:
         raise TypeError('It is impossible to compress'
                         'the empty dataframe.')
+    check_target = max_delta is not None or explained_variance is not None
+    is_target_met = False if check_target else None
+    original_df = dataframe
     n_components = len(dataframe.columns)
     # generating start vector w0
     vector_w = generate_start_w0(n_components)
@@ -163,23 +180,29 @@ def compress(dataframe):
         y_matrix.append(y_val)
         w_matrix.append(vector_w)
         dataframe = subtract_component(dataframe, y_val, vector_w)
-    return y_matrix, w_matrix
+        # the residual is what is lost after decompression
+        if check_target and is_accurate_enough(original_df, original_df - dataframe,
+                                               max_delta=max_delta,
+                                               explained_variance=explained_variance):
+            is_target_met = True
+            break
+    return y_matrix, w_matrix, is_target_met
 
 
 def decompress(matrix_y, matrix_w):
     """
     Applies Oja's decopmressing rule to the component.
     Args:
-        column_y (Numpy Array): vector [dataframe_len x 1] of components y.
-        vector_w (Numpy Array): eigen vectors w [1 x df_columns_len].
+        matrix_y (Numpy Array): vectors [dataframe_len x 1] of components y.
+        matrix_w (Numpy Array): eigen vectors w [1 x df_columns_len].
 
     Returns:
         Pandas DataFrame.
     """
-    rows, cols = len(matrix_y[0]), len(matrix_y)
+    rows, cols = len(matrix_y[0]), len(matrix_w[0])
     result_array = np.zeros((rows, cols))
     for i in range(rows):
-        for k in range(cols):
+        for k in range(len(matrix_y)):
             result_array[i] = result_array[i] + matrix_w[k] * matrix_y[k][i]
     return DataFrame(result_array)
 
@@ -204,8 +227,43 @@ def apply_oja(dataframe):
         raise TypeError("It is impossible to apply the Oja's rule"
                         "on the empty dataframe.")
     # compression
-    matrix_y, matrix_w = compress(dataframe)
+    matrix_y, matrix_w, _ = compress(dataframe)
     # decompression
     decompressed_df = decompress(matrix_y, matrix_w)
 
     return decompressed_df
+
+
+def apply_oja_to_target(dataframe, max_delta=None, explained_variance=None):
+    """
+    Implements algorithm of the Oja's rule for compression
+    and decompression data with the least number of the components
+    which meets the target reconstruction accuracy.
+    Args:
+        dataframe (Pandas DataFrame): contains data after
+            data preprocessing stage to compress.
+        max_delta (float): maximum allowed absolute delta value
+            in the whole DataFrame, not negative.
+        explained_variance (float): minimum share of the variance
+            to keep, in (0, 1].
+
+    Returns:
+        Tuple (Pandas DataFrame, int, bool):
+        decompressed DataFrame, the chosen number of the components
+        and if the target is met. If the target is never met,
+        all the components are used and the flag is False.
+
+    Raises:
+        TypeError: if the input DataFrame is empty or the targets are invalid.
+    """
+    if dataframe.empty:
+        raise TypeError("It is impossible to apply the Oja's rule"
+                        "on the empty dataframe.")
+    validate_target(max_delta, explained_variance)
+    # compression
+    matrix_y, matrix_w, is_target_met = compress(dataframe, max_delta=max_delta,
+                                                 explained_variance=explained_variance)
+    # decompression
+    decompressed_df = decompress(matrix_y, matrix_w)
+
+    return decompressed_df, len(matrix_y), is_target_met